@@ -1,23 +1,384 @@
 import yfinance as yf
 import pandas as pd
 import numpy as np
-import json
+import orjson
+import pyarrow as pa
+import pyarrow.parquet as pq
 import os
 import time
+import random
+import asyncio
+import hashlib
+import functools
+import threading
+import tempfile
+from types import MappingProxyType
 import requests
-from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import httpx
+import aiohttp
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+from collections import defaultdict
 import re
 import nltk
 from nltk.sentiment.vader import SentimentIntensityAnalyzer
 from bs4 import BeautifulSoup
 import tweepy
+from tweepy.asynchronous import AsyncClient, AsyncPaginator
+
+# Maximum number of NewsAPI requests in flight during a batch collection
+NEWS_CONCURRENCY_LIMIT = 5
+
+# Retry policy for throttled (429) or failing (5xx) HTTP requests: exponential backoff with jitter,
+# honouring the server's Retry-After header when it sends one
+HTTP_RETRIES = 5
+HTTP_BACKOFF_FACTOR = 0.5
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Twitter signals 429 with x-rate-limit-reset, which tweepy's wait_on_rate_limit handles itself
+TWITTER_RETRY_STATUSES = (500, 502, 503, 504)
+
+# Permissions for output files, as a plain open() would create them under the process umask (read once at
+# import, since os.umask can only be read by setting it)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+OUTPUT_FILE_MODE = 0o666 & ~_UMASK
+
+# Twitter API v2 rate limits are counted per 15-minute window
+TWITTER_RATE_WINDOW = 15 * 60
+
+# Longest query accepted by the Twitter API v2 recent search endpoint
+TWITTER_QUERY_MAX_LENGTH = 512
+
+# Search result pages each ticker is budgeted, whether it is searched alone or as part of a combined search
+TWEET_PAGES_PER_TICKER = 5
+
+# Recent search parameters: full pages, with authors hydrated so follower counts come back with each page
+_TWEET_SEARCH_PARAMS = {
+    "max_results": 100,
+    "tweet_fields": ["created_at", "public_metrics", "lang"],
+    "expansions": ["author_id"],
+    "user_fields": ["public_metrics"]
+}
+
+# Sentiment labels in the order they are counted in time series aggregates
+SENTIMENT_LABELS = ["positive", "negative", "neutral"]
+
+# Ticker universes by list type, built once and shared read-only
+_STOCK_LISTS = MappingProxyType({
+    # Major stocks that are often discussed in financial news and social media
+    "major": ("AAPL", "MSFT", "AMZN", "GOOGL", "META", "TSLA", "NVDA", "JPM", "BAC", "WMT"),
+    # Technology stocks with high social media presence
+    "tech": ("AAPL", "MSFT", "GOOGL", "META", "AMZN", "NVDA", "TSLA", "NFLX", "CRM", "ADBE", "INTC", "AMD", "PYPL", "UBER", "ABNB"),
+    # Financial stocks
+    "finance": ("JPM", "BAC", "WFC", "C", "GS", "MS", "BLK", "AXP", "V", "MA", "COF", "SCHW"),
+    # Stocks with higher volatility that might show stronger sentiment effects
+    "volatile": ("TSLA", "GME", "AMC", "COIN", "RIVN", "DKNG", "PLTR", "NIO", "SNAP", "RBLX", "HOOD", "SPCE"),
+    # Meme stocks with high social media activity
+    "meme": ("GME", "AMC", "BB", "EXPR", "KOSS", "NOK", "BBBY", "WISH", "CLOV", "MVIS", "TLRY", "SNDL"),
+})
+
+_CRYPTO_LISTS = MappingProxyType({
+    # Major cryptocurrencies
+    "major": ("BTC", "ETH", "BNB", "SOL", "XRP", "ADA", "DOGE", "DOT", "AVAX", "MATIC"),
+    # Meme cryptocurrencies with high social sentiment volatility
+    "meme": ("DOGE", "SHIB", "PEPE", "FLOKI", "BONK", "ELON", "SAMO", "WIF", "MONA", "BABYDOGE"),
+})
+
+# Finance-specific terms added to the VADER lexicon to improve sentiment scoring
+_FINANCE_LEXICON = {
+    # Positive financial terms
+    'bullish': 2.5, 'outperform': 2.0, 'buy': 2.0, 'upgrade': 2.0, 
+    'beat': 1.5, 'exceeded': 1.5, 'profit': 1.5, 'growth': 1.5,
+    'upside': 1.5, 'dividend': 1.0, 'uptrend': 1.5, 'rally': 1.5,
+    
+    # Negative financial terms
+    'bearish': -2.5, 'underperform': -2.0, 'sell': -2.0, 'downgrade': -2.0,
+    'miss': -1.5, 'below': -1.0, 'loss': -2.0, 'debt': -1.0,
+    'downside': -1.5, 'crash': -3.0, 'downtrend': -1.5, 'bankruptcy': -3.0,
+    'recession': -2.5, 'inflation': -1.0, 'volatility': -0.5
+}
+
+# Fixed-point scales for stored VADER scores: compound is rounded to 4 decimals, the rest to 3
+_SCORE_SCALES = {"compound": 10000, "positive": 1000, "negative": 1000, "neutral": 1000}
+
+# Tweet noise (URLs, mentions, RT markers) and whitespace runs, compiled once
+_TWEET_NOISE_RE = re.compile(r'http\S+|@\w+|RT\s+')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def _compute_indicators(closes, volumes, window=5):
+    """Compute rolling volatility, momentum and volume ratio in a single pass.
+    
+    Each value at index i is derived from the `window` periods before it, so the
+    first `window` entries are NaN. Volume ratios are NaN where the average volume is 0.
+    """
+    closes = np.asarray(closes, dtype=np.float64)
+    volumes = np.asarray(volumes, dtype=np.float64)
+    n = len(closes)
+    volatility = np.full(n, np.nan)
+    momentum = np.full(n, np.nan)
+    vol_ratio = np.full(n, np.nan)
+    if n <= window:
+        return volatility, momentum, vol_ratio
+    
+    # Windows of the `window` periods preceding each point from index `window` onwards
+    close_windows = np.lib.stride_tricks.sliding_window_view(closes, window)[:-1]
+    volume_avg = np.lib.stride_tricks.sliding_window_view(volumes, window)[:-1].mean(axis=1)
+    
+    with np.errstate(divide="ignore", invalid="ignore"):
+        volatility[window:] = close_windows.std(axis=1) / close_windows.mean(axis=1) * 100  # Percentage volatility
+        momentum[window:] = (closes[window:] - closes[:-window]) / closes[:-window] * 100
+        vol_ratio[window:] = np.where(volume_avg > 0, volumes[window:] / volume_avg, np.nan)
+    
+    return volatility, momentum, vol_ratio
+
+
+def _quantize_scores(values, field):
+    """Pack VADER scores into int16 fixed-point; lossless since VADER already rounds them."""
+    return np.rint(np.asarray(values, dtype=np.float64) * _SCORE_SCALES[field]).astype(np.int16)
+
+
+def _score_values(scores, field, limit=None):
+    """Unpack a fixed-point score column back to the float values VADER returned."""
+    return scores[field][:limit] / _SCORE_SCALES[field]
+
+
+def _sentiment_records(scores, limit=None):
+    """Materialize per-item sentiment dicts for output from a frame of score arrays."""
+    columns = [_score_values(scores, field, limit).tolist() for field in ("compound", "positive", "negative", "neutral")]
+    columns.append(scores["label"][:limit].tolist())
+    return [
+        {
+            "compound": compound,
+            "positive": positive,
+            "negative": negative,
+            "neutral": neutral,
+            "label": SENTIMENT_LABELS[label]
+        }
+        for compound, positive, negative, neutral, label in zip(*columns)
+    ]
+
+
+def _label_counts(bucket_idx, labels, n_buckets):
+    """Count sentiment labels per bucket as an (n_buckets, len(SENTIMENT_LABELS)) array."""
+    n_labels = len(SENTIMENT_LABELS)
+    return np.bincount(bucket_idx * n_labels + labels, minlength=n_buckets * n_labels).reshape(n_buckets, n_labels)
+
+
+def _format_datetimes(values):
+    """Format a datetime64 array as strings such as '2024-01-31 14' for hours or '2024-01-31 14:05:09' for seconds."""
+    return [value.replace("T", " ") for value in np.datetime_as_string(values).tolist()]
+
+
+def _combine_queries(queries):
+    """OR several Twitter search queries together, restricted to English tweets."""
+    return f"({' OR '.join(f'({query})' for query in queries)}) lang:en"
+
+
+def _query_terms_re(query):
+    """Compile a case-insensitive pattern matching the leading cashtag, hashtag or keyword of each OR clause."""
+    terms = [clause.split()[0] for clause in query.split(" OR ")]
+    return re.compile(r'(?<!\w)(?:' + '|'.join(map(re.escape, terms)) + r')(?!\w)', re.IGNORECASE)
+
+
+def _select_rows(columns, pattern):
+    """Keep the rows of a tweet column dict whose text matches `pattern`."""
+    rows = [i for i, text in enumerate(columns["text"]) if pattern.search(text)]
+    return {field: [values[i] for i in rows] for field, values in columns.items()}
+
+
+def _tweet_columns():
+    """Empty per-field columns for collected tweets."""
+    return {field: [] for field in ("id", "created_at", "text", "user_followers", "retweet_count", "favorite_count")}
+
+
+def _append_tweets(columns, response):
+    """Clean the tweets of one search response page and append them to `columns`."""
+    users = {user.id: user for user in response.includes.get("users", [])}
+    
+    for tweet in response.data or []:
+        # Clean text: drop URLs, mentions and RT markers in one pass, then normalize whitespace
+        text = _WHITESPACE_RE.sub(' ', _TWEET_NOISE_RE.sub('', tweet.text)).strip()
+        
+        if len(text) < 10:  # Skip very short tweets
+            continue
+        
+        author = users.get(tweet.author_id)
+        metrics = tweet.public_metrics or {}
+        
+        columns["id"].append(str(tweet.id))
+        columns["created_at"].append(tweet.created_at.replace(tzinfo=None))  # UTC
+        columns["text"].append(text)
+        columns["user_followers"].append(author.public_metrics["followers_count"] if author else 0)
+        columns["retweet_count"].append(metrics.get("retweet_count", 0))
+        columns["favorite_count"].append(metrics.get("like_count", 0))
+
+
+def _retry_delay(attempt, retry_after=None):
+    """Seconds to wait before retry number `attempt` (from 0): Retry-After if given in seconds, else jittered backoff."""
+    try:
+        return max(0.0, float(retry_after))
+    except (TypeError, ValueError):
+        return HTTP_BACKOFF_FACTOR * 2 ** attempt + random.uniform(0, HTTP_BACKOFF_FACTOR)
+
+
+def _read_cache(path, ttl):
+    """Return the cached JSON payload at `path`, or None if it is missing or older than `ttl` seconds."""
+    try:
+        if time.time() - os.path.getmtime(path) < ttl:
+            with open(path, "rb") as f:
+                return orjson.loads(f.read())
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _atomic_write(path, payload, mode=None):
+    """Write `payload` bytes to a temp file next to `path` and swap it in, so readers never see a partial file.
+    
+    The temp file is private (0600); pass `mode` to give the final file other permissions.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except Exception:
+        os.remove(tmp_path)
+        raise
+
+
+def _write_cache(path, data):
+    """Atomically write a JSON payload to the cache."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    _atomic_write(path, orjson.dumps(data))
+
+
+def _to_builtin(value):
+    """Convert NumPy scalars and arrays to built-in Python values for the binary encoders."""
+    if isinstance(value, (np.generic, np.ndarray)):
+        return value.tolist()
+    raise TypeError(f"Type is not serializable: {type(value).__name__}")
+
+
+def _output_encoder(serialization_format):
+    """Return a function encoding an output payload as bytes; binary formats are imported only when chosen."""
+    if serialization_format == "json":
+        return functools.partial(orjson.dumps, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY)
+    if serialization_format == "cbor":
+        import cbor2
+        return functools.partial(cbor2.dumps, default=lambda encoder, value: encoder.encode(_to_builtin(value)))
+    if serialization_format == "msgpack":
+        import msgpack
+        return functools.partial(msgpack.packb, use_bin_type=True, default=_to_builtin)
+    raise ValueError(f"Unsupported serialization format: {serialization_format!r} (expected json, cbor or msgpack)")
+
+
+def _write_parquet(path, frames):
+    """Write per-ticker DataFrames to one zstd-compressed Parquet file with a leading ticker column."""
+    df = pd.concat(frames.values(), keys=list(frames), names=["ticker", None]).reset_index(level="ticker")
+    buf = pa.BufferOutputStream()
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), buf, compression="zstd")
+    _atomic_write(path, buf.getvalue().to_pybytes(), OUTPUT_FILE_MODE)
+
+
+@functools.lru_cache(maxsize=1024)
+def _short_name(ticker):
+    """Company short name for a ticker, memoized since `.info` is a slow, rate-limited Yahoo request."""
+    return yf.Ticker(ticker).info.get("shortName", ticker)
+
+
+class _RateLimiter:
+    """Thread-safe token bucket allowing `calls` requests per `period` seconds.
+    
+    Usable as a context manager from worker threads or as an async context manager
+    from coroutines; callers only wait once the budget is exhausted.
+    """
+    
+    def __init__(self, calls, period=1.0):
+        self.capacity = calls
+        self.rate = calls / period
+        self.tokens = float(calls)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def _reserve(self):
+        """Take a token and return how many seconds the caller must wait before using it."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return max(0.0, -self.tokens / self.rate)
+    
+    def acquire(self):
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+    
+    async def acquire_async(self):
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
+    
+    def __call__(self, func):
+        """Wrap `func` (a function or coroutine function) so every call spends a token first."""
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def limited_async(*args, **kwargs):
+                async with self:
+                    return await func(*args, **kwargs)
+            return limited_async
+        
+        @functools.wraps(func)
+        def limited(*args, **kwargs):
+            with self:
+                return func(*args, **kwargs)
+        return limited
+    
+    def __enter__(self):
+        self.acquire()
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+    
+    async def __aenter__(self):
+        await self.acquire_async()
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+def _load_sentiment_analyzer():
+    """Create the VADER analyzer shared by all collectors, with the finance lexicon applied."""
+    try:
+        nltk.data.find('sentiment/vader_lexicon.zip')
+    except LookupError:
+        nltk.download('vader_lexicon')
+    
+    analyzer = SentimentIntensityAnalyzer()
+    analyzer.lexicon.update(_FINANCE_LEXICON)
+    return analyzer
+
+
+# Loaded once per process: reading and parsing the VADER lexicon is the expensive part
+_ANALYZER = _load_sentiment_analyzer()
+
 
 class FinancialSentimentCollector:
     def __init__(self, output_dir="financial_sentiment_data", 
                  twitter_api_key=None, twitter_api_secret=None, 
                  twitter_access_token=None, twitter_access_secret=None,
-                 newsapi_key=None):
+                 newsapi_key=None, news_cache_ttl=6 * 3600, page_cache_ttl=3600, social_cache_ttl=3600,
+                 max_requests_per_second=2, twitter_bearer_token=None,
+                 news_requests_per_second=1, twitter_requests_per_window=180,
+                 serialization_format="json"):
         """
         Initialize the Financial Sentiment Data Collector.
         
@@ -28,6 +389,17 @@ class FinancialSentimentCollector:
             twitter_access_token (str): Twitter access token (optional)
             twitter_access_secret (str): Twitter access token secret (optional)
             newsapi_key (str): NewsAPI key (optional)
+            news_cache_ttl (int): Seconds a cached NewsAPI response stays valid
+            page_cache_ttl (int): Seconds a cached scraped news page stays valid
+            social_cache_ttl (int): Seconds cached tweet search results stay valid
+            max_requests_per_second (float): Request budget shared by all workers for Yahoo Finance calls
+            twitter_bearer_token (str): Twitter API v2 app-only bearer token (optional, 
+                alternative to the user-context keys above)
+            news_requests_per_second (float): Request budget shared by all workers for NewsAPI calls
+            twitter_requests_per_window (int): Recent search requests allowed per 15-minute window
+                (180 for user context, 450 for app-only auth)
+            serialization_format (str): Per-ticker output format: 'json', 'cbor' (needs cbor2) or
+                'msgpack' (needs msgpack); files get the matching extension
         """
         self.output_dir = output_dir
         if not os.path.exists(output_dir):
@@ -38,6 +410,7 @@ class FinancialSentimentCollector:
         self.news_dir = os.path.join(output_dir, "news_sentiment")
         self.social_dir = os.path.join(output_dir, "social_sentiment")
         self.combined_dir = os.path.join(output_dir, "combined_data")
+        self.cache_dir = os.path.join(output_dir, ".cache")
         
         for directory in [self.price_dir, self.news_dir, self.social_dir, self.combined_dir]:
             if not os.path.exists(directory):
@@ -45,8 +418,9 @@ class FinancialSentimentCollector:
         
         # Set up API credentials
         self.twitter_credentials = None
-        if all([twitter_api_key, twitter_api_secret, twitter_access_token, twitter_access_secret]):
+        if twitter_bearer_token or all([twitter_api_key, twitter_api_secret, twitter_access_token, twitter_access_secret]):
             self.twitter_credentials = {
+                "bearer_token": twitter_bearer_token,
                 "api_key": twitter_api_key,
                 "api_secret": twitter_api_secret,
                 "access_token": twitter_access_token,
@@ -54,259 +428,321 @@ class FinancialSentimentCollector:
             }
         
         self.newsapi_key = newsapi_key
+        self.news_cache_ttl = news_cache_ttl
+        self.page_cache_ttl = page_cache_ttl
+        self.social_cache_ttl = social_cache_ttl
         
-        # Set up NLTK for sentiment analysis
-        try:
-            nltk.data.find('vader_lexicon')
-        except LookupError:
-            nltk.download('vader_lexicon')
-            nltk.download('punkt')
-        
-        self.sentiment_analyzer = SentimentIntensityAnalyzer()
-        
-        # Add finance-specific terms to VADER lexicon to improve sentiment scoring
-        self.update_vader_lexicon()
-    
-    def update_vader_lexicon(self):
-        """Update VADER lexicon with finance-specific terms"""
-        finance_lexicon = {
-            # Positive financial terms
-            'bullish': 2.5, 'outperform': 2.0, 'buy': 2.0, 'upgrade': 2.0, 
-            'beat': 1.5, 'exceeded': 1.5, 'profit': 1.5, 'growth': 1.5,
-            'upside': 1.5, 'dividend': 1.0, 'uptrend': 1.5, 'rally': 1.5,
-            
-            # Negative financial terms
-            'bearish': -2.5, 'underperform': -2.0, 'sell': -2.0, 'downgrade': -2.0,
-            'miss': -1.5, 'below': -1.0, 'loss': -2.0, 'debt': -1.0,
-            'downside': -1.5, 'crash': -3.0, 'downtrend': -1.5, 'bankruptcy': -3.0,
-            'recession': -2.5, 'inflation': -1.0, 'volatility': -0.5
-        }
+        # Per-provider rate limits, enforced when requests are made, whichever worker makes them
+        self.yahoo_limiter = _RateLimiter(max_requests_per_second)
+        self.news_limiter = _RateLimiter(news_requests_per_second)
+        self.twitter_limiter = _RateLimiter(twitter_requests_per_window, TWITTER_RATE_WINDOW)
+        
+        # Shared HTTP session so repeated requests reuse pooled keep-alive connections
+        self.http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16, pool_maxsize=64,
+            max_retries=Retry(total=HTTP_RETRIES, backoff_factor=HTTP_BACKOFF_FACTOR, 
+                              backoff_jitter=HTTP_BACKOFF_FACTOR, status_forcelist=HTTP_RETRY_STATUSES, 
+                              allowed_methods=["GET", "HEAD"], respect_retry_after_header=True, 
+                              raise_on_status=False)
+        )
+        self.http.mount("https://", adapter)
+        
+        # Separate pooled session for Twitter: 429s are left to tweepy so waits follow the reset header
+        self.twitter_http = requests.Session()
+        self.twitter_http.mount("https://", HTTPAdapter(
+            pool_connections=4, pool_maxsize=16,
+            max_retries=Retry(total=HTTP_RETRIES, backoff_factor=HTTP_BACKOFF_FACTOR, 
+                              backoff_jitter=HTTP_BACKOFF_FACTOR, status_forcelist=TWITTER_RETRY_STATUSES, 
+                              allowed_methods=["GET"], raise_on_status=False)
+        ))
         
-        # Update the lexicon
-        self.sentiment_analyzer.lexicon.update(finance_lexicon)
+        # Twitter API v2 client shared by all social workers, using its own pooled session above.
+        # User context auth is used when no bearer token is given.
+        self.twitter_client = None
+        if self.twitter_credentials:
+            self.twitter_client = tweepy.Client(
+                bearer_token=twitter_bearer_token,
+                consumer_key=twitter_api_key,
+                consumer_secret=twitter_api_secret,
+                access_token=twitter_access_token,
+                access_token_secret=twitter_access_secret,
+                wait_on_rate_limit=True
+            )
+            self.twitter_client.session = self.twitter_http
+        self.twitter_user_auth = twitter_bearer_token is None
+        
+        # Output files are written in the background so disk I/O overlaps with collection
+        self.serialization_format = serialization_format
+        self._encode_output = _output_encoder(serialization_format)
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+        
+        # Shared VADER analyzer, already extended with finance-specific terms
+        self.sentiment_analyzer = _ANALYZER
+    
+    def close(self):
+        """Wait for pending background writes, then release the I/O pool and pooled HTTP connections."""
+        self._io_pool.shutdown(wait=True)
+        self.http.close()
+        self.twitter_http.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
     
     def _get_stock_list(self, list_type="major"):
-        """Get a list of stock tickers based on the specified type."""
-        if list_type == "major":
-            # Major stocks that are often discussed in financial news and social media
-            return ["AAPL", "MSFT", "AMZN", "GOOGL", "META", "TSLA", "NVDA", "JPM", "BAC", "WMT"]
-        elif list_type == "tech":
-            # Technology stocks with high social media presence
-            return ["AAPL", "MSFT", "GOOGL", "META", "AMZN", "NVDA", "TSLA", "NFLX", "CRM", "ADBE", "INTC", "AMD", "PYPL", "UBER", "ABNB"]
-        elif list_type == "finance":
-            # Financial stocks
-            return ["JPM", "BAC", "WFC", "C", "GS", "MS", "BLK", "AXP", "V", "MA", "COF", "SCHW"]
-        elif list_type == "volatile":
-            # Stocks with higher volatility that might show stronger sentiment effects
-            return ["TSLA", "GME", "AMC", "COIN", "RIVN", "DKNG", "PLTR", "NIO", "SNAP", "RBLX", "HOOD", "SPCE"]
-        elif list_type == "meme":
-            # Meme stocks with high social media activity
-            return ["GME", "AMC", "BB", "EXPR", "KOSS", "NOK", "BBBY", "WISH", "CLOV", "MVIS", "TLRY", "SNDL"]
-        else:
-            # Default to major stocks
-            return ["AAPL", "MSFT", "AMZN", "GOOGL", "META", "TSLA", "NVDA", "JPM", "BAC", "WMT"]
+        """Get a tuple of stock tickers based on the specified type (defaults to major stocks)."""
+        return _STOCK_LISTS.get(list_type, _STOCK_LISTS["major"])
     
     def _get_crypto_list(self, list_type="major"):
-        """Get a list of cryptocurrency tickers based on the specified type."""
-        if list_type == "major":
-            # Major cryptocurrencies
-            return ["BTC", "ETH", "BNB", "SOL", "XRP", "ADA", "DOGE", "DOT", "AVAX", "MATIC"]
-        elif list_type == "meme":
-            # Meme cryptocurrencies with high social sentiment volatility
-            return ["DOGE", "SHIB", "PEPE", "FLOKI", "BONK", "ELON", "SAMO", "WIF", "MONA", "BABYDOGE"]
-        else:
-            # Default to major cryptocurrencies
-            return ["BTC", "ETH", "BNB", "SOL", "XRP", "ADA", "DOGE", "DOT", "AVAX", "MATIC"]
+        """Get a tuple of cryptocurrency tickers based on the specified type (defaults to major cryptocurrencies)."""
+        return _CRYPTO_LISTS.get(list_type, _CRYPTO_LISTS["major"])
+    
+    def _score_texts(self, texts):
+        """Score a batch of texts with VADER into a frame of per-field arrays.
+        
+        Each distinct text is analysed only once. Scores are stored as int16 fixed-point
+        values (see _SCORE_SCALES) and label codes index into SENTIMENT_LABELS.
+        """
+        scores = {}
+        for text in texts:
+            if text not in scores:
+                scores[text] = self.sentiment_analyzer.polarity_scores(text)
+        sentiments = [scores[text] for text in texts]
+        
+        compound = np.array([sentiment["compound"] for sentiment in sentiments], dtype=np.float64)
+        return {
+            "compound": _quantize_scores(compound, "compound"),
+            "positive": _quantize_scores([sentiment["pos"] for sentiment in sentiments], "positive"),
+            "negative": _quantize_scores([sentiment["neg"] for sentiment in sentiments], "negative"),
+            "neutral": _quantize_scores([sentiment["neu"] for sentiment in sentiments], "neutral"),
+            "label": np.select([compound >= 0.05, compound <= -0.05], [0, 1], 2).astype(np.int8)
+        }
     
     def collect_price_data(self, ticker, asset_type, period="30d", interval="1h"):
         """Collect price data with finer granularity for real-time sentiment analysis."""
         try:
             ticker_obj = yf.Ticker(ticker if asset_type != "crypto" else f"{ticker}-USD")
-            hist = ticker_obj.history(period=period, interval=interval)
-            
-            if hist.empty:
-                return {"error": f"No historical data available for {ticker}"}
-            
-            # Convert to structured format
-            price_data = []
-            for date, row in hist.iterrows():
-                data_point = {
-                    "timestamp": date.strftime("%Y-%m-%d %H:%M:%S"),
-                    "open": float(row["Open"]) if not np.isnan(row["Open"]) else None,
-                    "high": float(row["High"]) if not np.isnan(row["High"]) else None,
-                    "low": float(row["Low"]) if not np.isnan(row["Low"]) else None,
-                    "close": float(row["Close"]) if not np.isnan(row["Close"]) else None,
-                    "volume": int(row["Volume"]) if not np.isnan(row["Volume"]) else None
-                }
-                price_data.append(data_point)
-            
-            # Calculate short-term technical indicators relevant for sentiment analysis
-            if len(price_data) > 10:
-                closes = hist["Close"].values
-                volumes = hist["Volume"].values
-                
-                # Calculate rolling volatility (5-period)
-                for i in range(5, len(price_data)):
-                    window = closes[i-5:i]
-                    volatility = float(np.std(window) / np.mean(window) * 100)  # Percentage volatility
-                    price_data[i]["volatility_5period"] = round(volatility, 2)
-                
-                # Calculate momentum (change over last 5 periods)
-                for i in range(5, len(price_data)):
-                    momentum = float((closes[i] - closes[i-5]) / closes[i-5] * 100)
-                    price_data[i]["momentum_5period"] = round(momentum, 2)
-                
-                # Calculate volume surge (ratio to 5-period average)
-                for i in range(5, len(price_data)):
-                    avg_volume = np.mean(volumes[i-5:i])
-                    if avg_volume > 0:
-                        vol_ratio = float(volumes[i] / avg_volume)
-                        price_data[i]["volume_ratio_5period"] = round(vol_ratio, 2)
+            with self.yahoo_limiter:
+                hist = ticker_obj.history(period=period, interval=interval)
             
-            return {
-                "ticker": ticker,
-                "asset_type": asset_type,
-                "interval": interval,
-                "price_data": price_data,
-                "metadata": {
-                    "period": period,
-                    "data_points": len(price_data),
-                    "start_time": price_data[0]["timestamp"] if price_data else None,
-                    "end_time": price_data[-1]["timestamp"] if price_data else None,
-                    "collected_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                }
-            }
+            return self._compute_price_payload(hist, ticker, asset_type, period, interval)
             
         except Exception as e:
             return {"ticker": ticker, "error": str(e)}
     
+    def _compute_price_payload(self, hist, ticker, asset_type, period, interval):
+        """Build the price data payload from an already downloaded price history."""
+        if hist.empty:
+            return {"error": f"No historical data available for {ticker}"}
+        
+        closes = hist["Close"].to_numpy()
+        volumes = hist["Volume"].to_numpy()
+        
+        # Convert to structured format, with missing values as None
+        frame = hist[["Open", "High", "Low", "Close", "Volume"]].rename(columns=str.lower).astype({"volume": "Int64"})
+        frame.insert(0, "timestamp", hist.index.strftime("%Y-%m-%d %H:%M:%S"))
+        price_data = frame.astype(object).where(frame.notna(), None).to_dict("records")
+        
+        # Calculate short-term technical indicators relevant for sentiment analysis
+        if len(price_data) > 10:
+            volatility, momentum, vol_ratio = _compute_indicators(closes, volumes)
+            
+            for i in range(5, len(price_data)):
+                price_data[i]["volatility_5period"] = round(float(volatility[i]), 2)
+                price_data[i]["momentum_5period"] = round(float(momentum[i]), 2)
+                if not np.isnan(vol_ratio[i]):
+                    price_data[i]["volume_ratio_5period"] = round(float(vol_ratio[i]), 2)
+        
+        return {
+            "ticker": ticker,
+            "asset_type": asset_type,
+            "interval": interval,
+            "price_data": price_data,
+            "metadata": {
+                "period": period,
+                "data_points": len(price_data),
+                "start_time": price_data[0]["timestamp"] if price_data else None,
+                "end_time": price_data[-1]["timestamp"] if price_data else None,
+                "collected_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            }
+        }
+    
     def collect_news_sentiment(self, ticker, asset_type, days_back=7):
         """Collect news sentiment for a ticker over the specified period."""
+        return asyncio.run(self._collect_news(ticker, asset_type, days_back, self._get_news_threaded))
+    
+    async def collect_news_sentiment_batch(self, tickers, asset_type, days_back=7):
+        """Collect news sentiment for a batch of tickers concurrently over one async HTTP client."""
+        sem = asyncio.Semaphore(NEWS_CONCURRENCY_LIMIT)
+        # Keep-alive pool sized to the concurrency limit so each in-flight request reuses a socket
+        limits = httpx.Limits(max_connections=NEWS_CONCURRENCY_LIMIT, max_keepalive_connections=NEWS_CONCURRENCY_LIMIT)
+        async with httpx.AsyncClient(timeout=15, limits=limits) as client:
+            get = functools.partial(self._get_news_async, client)
+            
+            async def fetch(ticker):
+                async with sem:
+                    return await self._collect_news(ticker, asset_type, days_back, get)
+            
+            news = await asyncio.gather(*(fetch(ticker) for ticker in tickers))
+        
+        return dict(zip(tickers, news))
+    
+    async def _collect_news(self, ticker, asset_type, days_back, get):
+        """Collect news sentiment for a ticker, fetching NewsAPI URLs with the coroutine function `get`."""
         if not self.newsapi_key:
             # Try to get financial news from alternative sources if NewsAPI key not available
-            return self.collect_alternative_news(ticker, asset_type, days_back)
+            return await asyncio.to_thread(self.collect_alternative_news, ticker, asset_type, days_back)
         
         try:
-            # Prepare for API call
-            if asset_type == "crypto":
-                if ticker == "BTC":
-                    query = "Bitcoin OR BTC"
-                elif ticker == "ETH":
-                    query = "Ethereum OR ETH"
-                else:
-                    query = f"{ticker} cryptocurrency"
-            else:
-                company_name = yf.Ticker(ticker).info.get("shortName", ticker)
-                query = f"({ticker} OR {company_name}) stock"
+            # Company name lookup goes through yfinance, which is blocking
+            query = await asyncio.to_thread(self._news_query, ticker, asset_type)
             
             # Calculate date range
             end_date = datetime.now()
             start_date = end_date - timedelta(days=days_back)
             
-            # Make API request to NewsAPI
-            url = f"https://newsapi.org/v2/everything?q={query}&from={start_date.strftime('%Y-%m-%d')}&to={end_date.strftime('%Y-%m-%d')}&language=en&sortBy=publishedAt&apiKey={self.newsapi_key}"
-            response = requests.get(url)
+            cache_path = self._news_cache_path(ticker, query, start_date, end_date)
+            news_data = _read_cache(cache_path, self.news_cache_ttl)
             
-            if response.status_code != 200:
-                return self.collect_alternative_news(ticker, asset_type, days_back)
+            if news_data is None:
+                # Make API request to NewsAPI
+                response = await get(self._news_url(query, start_date, end_date))
+                
+                if response.status_code != 200:
+                    return await asyncio.to_thread(self.collect_alternative_news, ticker, asset_type, days_back)
+                
+                news_data = orjson.loads(response.content)
+                if news_data.get("status") == "ok":
+                    _write_cache(cache_path, news_data)
             
-            news_data = response.json()
             if news_data.get("status") != "ok" or news_data.get("totalResults", 0) == 0:
-                return self.collect_alternative_news(ticker, asset_type, days_back)
+                return await asyncio.to_thread(self.collect_alternative_news, ticker, asset_type, days_back)
             
-            # Process articles
-            articles = []
-            for article in news_data.get("articles", []):
-                # Combine title and description for sentiment analysis
-                text = f"{article.get('title', '')} {article.get('description', '')}"
-                
-                # Skip if no meaningful text
-                if len(text.strip()) < 20:
-                    continue
-                
-                # Get sentiment scores
-                sentiment = self.sentiment_analyzer.polarity_scores(text)
-                
-                # Create article entry
-                article_data = {
-                    "source": article.get("source", {}).get("name"),
-                    "title": article.get("title"),
-                    "published_at": article.get("publishedAt"),
-                    "url": article.get("url"),
-                    "sentiment": {
-                        "compound": sentiment["compound"],
-                        "positive": sentiment["pos"],
-                        "negative": sentiment["neg"],
-                        "neutral": sentiment["neu"],
-                        "label": "positive" if sentiment["compound"] >= 0.05 else 
-                                 "negative" if sentiment["compound"] <= -0.05 else "neutral"
-                    }
-                }
-                articles.append(article_data)
+            # Scoring is CPU-bound, so it runs off the event loop shared with the other requests
+            return await asyncio.to_thread(self._process_news_articles, news_data, ticker, asset_type, days_back, 
+                                           start_date, end_date)
             
-            # Group articles by day for time series analysis
-            daily_sentiment = {}
-            for article in articles:
-                try:
-                    date = article["published_at"].split("T")[0]
-                    if date not in daily_sentiment:
-                        daily_sentiment[date] = {
-                            "articles": 0,
-                            "sentiment_sum": 0,
-                            "positive_count": 0,
-                            "negative_count": 0,
-                            "neutral_count": 0
-                        }
-                    
-                    daily_sentiment[date]["articles"] += 1
-                    daily_sentiment[date]["sentiment_sum"] += article["sentiment"]["compound"]
-                    
-                    if article["sentiment"]["label"] == "positive":
-                        daily_sentiment[date]["positive_count"] += 1
-                    elif article["sentiment"]["label"] == "negative":
-                        daily_sentiment[date]["negative_count"] += 1
-                    else:
-                        daily_sentiment[date]["neutral_count"] += 1
-                except Exception:
-                    continue
+        except Exception as e:
+            return {"ticker": ticker, "error": str(e)}
+    
+    async def _get_news_threaded(self, url):
+        """GET a NewsAPI URL from a worker thread on the pooled session, whose adapter handles retries."""
+        async with self.news_limiter:
+            return await asyncio.to_thread(self.http.get, url, timeout=10)
+    
+    async def _get_news_async(self, client, url):
+        """GET a NewsAPI URL, retrying throttled and failed responses like the sync session's adapter does."""
+        for attempt in range(HTTP_RETRIES + 1):
+            async with self.news_limiter:
+                response = await client.get(url, timeout=10)
             
-            # Calculate daily average sentiment
-            daily_averages = []
-            for date, data in daily_sentiment.items():
-                if data["articles"] > 0:
-                    avg_sentiment = data["sentiment_sum"] / data["articles"]
-                    daily_averages.append({
-                        "date": date,
-                        "articles_count": data["articles"],
-                        "avg_sentiment": round(avg_sentiment, 3),
-                        "positive_ratio": round(data["positive_count"] / data["articles"], 3),
-                        "negative_ratio": round(data["negative_count"] / data["articles"], 3),
-                        "neutral_ratio": round(data["neutral_count"] / data["articles"], 3)
-                    })
+            if response.status_code not in HTTP_RETRY_STATUSES or attempt == HTTP_RETRIES:
+                return response
+            await asyncio.sleep(_retry_delay(attempt, response.headers.get("Retry-After")))
+    
+    def _news_query(self, ticker, asset_type):
+        """Build the NewsAPI search query for a ticker."""
+        if asset_type == "crypto":
+            if ticker == "BTC":
+                return "Bitcoin OR BTC"
+            elif ticker == "ETH":
+                return "Ethereum OR ETH"
+            else:
+                return f"{ticker} cryptocurrency"
+        
+        company_name = _short_name(ticker)
+        return f"({ticker} OR {company_name}) stock"
+    
+    def _news_url(self, query, start_date, end_date):
+        """Build the NewsAPI request URL for a query and date range."""
+        return f"https://newsapi.org/v2/everything?q={query}&from={start_date.strftime('%Y-%m-%d')}&to={end_date.strftime('%Y-%m-%d')}&language=en&sortBy=publishedAt&apiKey={self.newsapi_key}"
+    
+    def _news_cache_path(self, ticker, query, start_date, end_date):
+        """Cache file for a NewsAPI response, keyed by ticker, query and date range."""
+        key = hashlib.md5(f"{ticker}|{query}|{start_date.strftime('%Y-%m-%d')}|{end_date.strftime('%Y-%m-%d')}".encode()).hexdigest()
+        return os.path.join(self.cache_dir, "news", f"{key}.json")
+    
+    def _process_news_articles(self, news_data, ticker, asset_type, days_back, start_date, end_date):
+        """Score NewsAPI articles and build the news sentiment payload."""
+        # Process articles
+        articles = []
+        texts = []
+        for article in news_data.get("articles", []):
+            # Combine title and description for sentiment analysis
+            text = f"{article.get('title', '')} {article.get('description', '')}"
             
-            return {
-                "ticker": ticker,
-                "asset_type": asset_type,
-                "news_sentiment": {
-                    "daily_averages": sorted(daily_averages, key=lambda x: x["date"]),
-                    "articles": articles
-                },
-                "metadata": {
-                    "total_articles": len(articles),
-                    "period_days": days_back,
-                    "start_date": start_date.strftime("%Y-%m-%d"),
-                    "end_date": end_date.strftime("%Y-%m-%d"),
-                    "collected_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                }
+            # Skip if no meaningful text
+            if len(text.strip()) < 20:
+                continue
+            
+            # Create article entry
+            article_data = {
+                "source": article.get("source", {}).get("name"),
+                "title": article.get("title"),
+                "published_at": article.get("publishedAt"),
+                "url": article.get("url")
             }
+            articles.append(article_data)
+            texts.append(text)
+        
+        # Get sentiment scores for all articles at once, kept as arrays until output
+        scores = self._score_texts(texts)
+        
+        # Group articles by day for time series analysis (articles without a publish date are left out)
+        daily_averages = []
+        dates = [article["published_at"].split("T")[0] if isinstance(article["published_at"], str) else None 
+                 for article in articles]
+        dated = np.array([date is not None for date in dates], dtype=bool)
+        if dated.any():
+            days, day_idx = np.unique(np.array([date for date in dates if date is not None]), return_inverse=True)
+            compound = _score_values(scores, "compound")[dated]
             
-        except Exception as e:
-            return {"ticker": ticker, "error": str(e)}
+            counts = np.bincount(day_idx)
+            sentiment_sum = np.bincount(day_idx, weights=compound)
+            label_counts = _label_counts(day_idx, scores["label"][dated], len(days))
+            
+            # Calculate daily average sentiment
+            avg_sentiment = sentiment_sum / counts
+            ratios = label_counts / counts[:, None]
+            for date, count, avg, (positive, negative, neutral) in zip(
+                    days.tolist(), counts.tolist(), avg_sentiment.tolist(), ratios.tolist()):
+                daily_averages.append({
+                    "date": date,
+                    "articles_count": count,
+                    "avg_sentiment": round(avg, 3),
+                    "positive_ratio": round(positive, 3),
+                    "negative_ratio": round(negative, 3),
+                    "neutral_ratio": round(neutral, 3)
+                })
+        
+        for article_data, sentiment in zip(articles, _sentiment_records(scores)):
+            article_data["sentiment"] = sentiment
+        
+        return {
+            "ticker": ticker,
+            "asset_type": asset_type,
+            "news_sentiment": {
+                "daily_averages": sorted(daily_averages, key=lambda x: x["date"]),
+                "articles": articles
+            },
+            "metadata": {
+                "total_articles": len(articles),
+                "period_days": days_back,
+                "start_date": start_date.strftime("%Y-%m-%d"),
+                "end_date": end_date.strftime("%Y-%m-%d"),
+                "collected_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            }
+        }
     
     def collect_alternative_news(self, ticker, asset_type, days_back=7):
         """Fallback method to collect financial news from public sources."""
         try:
             articles = []
+            titles = []
             
             # Define search URL based on asset type
             if asset_type == "crypto":
@@ -333,26 +769,33 @@ class FinancialSentimentCollector:
                     headers = {
                         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
                     }
-                    response = requests.get(url, headers=headers, timeout=10)
+                    page_path = os.path.join(self.cache_dir, "pages", f"{hashlib.md5(url.encode()).hexdigest()}.json")
+                    html = _read_cache(page_path, self.page_cache_ttl)
                     
-                    if response.status_code == 200:
-                        soup = BeautifulSoup(response.text, 'html.parser')
+                    if html is None:
+                        response = self.http.get(url, headers=headers, timeout=10)
+                        if response.status_code == 200:
+                            html = response.text
+                            _write_cache(page_path, html)
+                    
+                    if html is not None:
+                        soup = BeautifulSoup(html, 'lxml')
                         
-                        # Extract article elements (simplified - real implementation would need site-specific parsing)
-                        article_elements = soup.find_all('article') or soup.find_all('div', class_=lambda x: x and ('article' in x.lower() or 'story' in x.lower()))
+                        # Extract article elements (simplified - real implementation would need site-specific parsing),
+                        # limited to the first 20 articles
+                        article_elements = (soup.select("article", limit=20) or 
+                                            soup.select("div[class*='article' i], div[class*='story' i]", limit=20))
                         
-                        for element in article_elements[:20]:  # Limit to first 20 articles
+                        for element in article_elements:
                             title_element = element.find('h2') or element.find('h3')
                             if not title_element:
                                 continue
                                 
                             title = title_element.get_text().strip()
                             
-                            # Calculate sentiment
-                            sentiment = self.sentiment_analyzer.polarity_scores(title)
-                            
                             # Try to find publication date
-                            date_element = element.find('time') or element.find('span', class_=lambda x: x and ('date' in x.lower() or 'time' in x.lower()))
+                            date_element = (element.select_one("time") or 
+                                            element.select_one("span[class*='date' i], span[class*='time' i]"))
                             pub_date = date_element.get_text().strip() if date_element else "N/A"
                             
                             # Create article entry
@@ -360,21 +803,18 @@ class FinancialSentimentCollector:
                                 "source": url.split('/')[2],
                                 "title": title,
                                 "published_at": pub_date,
-                                "url": "N/A",  # Would extract actual URL in real implementation
-                                "sentiment": {
-                                    "compound": sentiment["compound"],
-                                    "positive": sentiment["pos"],
-                                    "negative": sentiment["neg"],
-                                    "neutral": sentiment["neu"],
-                                    "label": "positive" if sentiment["compound"] >= 0.05 else 
-                                             "negative" if sentiment["compound"] <= -0.05 else "neutral"
-                                }
+                                "url": "N/A"  # Would extract actual URL in real implementation
                             }
                             articles.append(article_data)
+                            titles.append(title)
                             
                 except Exception:
                     continue
             
+            # Calculate sentiment for all collected titles at once
+            for article_data, sentiment in zip(articles, _sentiment_records(self._score_texts(titles))):
+                article_data["sentiment"] = sentiment
+            
             # If we couldn't get articles, return a status
             if not articles:
                 return {
@@ -404,261 +844,379 @@ class FinancialSentimentCollector:
     
     def collect_social_sentiment(self, ticker, asset_type, days_back=3):
         """Collect social media sentiment for a ticker."""
+        return self.collect_social_sentiment_batch([ticker], asset_type, days_back)[ticker]
+    
+    def collect_social_sentiment_batch(self, tickers, asset_type, days_back=3):
+        """Collect social media sentiment for several tickers with one combined search per chunk of tickers.
+        
+        Tweets found by a combined search are assigned to every ticker whose cashtag, hashtag
+        or keyword they mention.
+        """
         if not self.twitter_credentials:
-            return {"ticker": ticker, "status": "Twitter API credentials not provided"}
+            return {ticker: {"ticker": ticker, "status": "Twitter API credentials not provided"} for ticker in tickers}
+        
+        async def collect():
+            results = {}
+            for chunk in self._social_chunks(tickers, asset_type):
+                results.update(await self._collect_social_chunk(chunk, asset_type, days_back, self._search_tweets_threaded))
+            return results
+        
+        return asyncio.run(collect())
+    
+    async def collect_social_sentiment_batch_async(self, tickers, asset_type, days_back=3):
+        """Async counterpart of collect_social_sentiment_batch, searching all chunks concurrently."""
+        if not self.twitter_credentials:
+            return {ticker: {"ticker": ticker, "status": "Twitter API credentials not provided"} for ticker in tickers}
+        
+        client = AsyncClient(
+            bearer_token=self.twitter_credentials["bearer_token"],
+            consumer_key=self.twitter_credentials["api_key"],
+            consumer_secret=self.twitter_credentials["api_secret"],
+            access_token=self.twitter_credentials["access_token"],
+            access_token_secret=self.twitter_credentials["access_secret"],
+            wait_on_rate_limit=True
+        )
+        async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit_per_host=10)) as session:
+            client.session = session
+            search = functools.partial(self._search_tweets_async, client)
+            tasks = [self._collect_social_chunk(chunk, asset_type, days_back, search) 
+                     for chunk in self._social_chunks(tickers, asset_type)]
+            chunk_results = await asyncio.gather(*tasks)
+        
+        return {ticker: data for results in chunk_results for ticker, data in results.items()}
+    
+    async def _collect_social_chunk(self, chunk, asset_type, days_back, search):
+        """Run one combined search for a chunk of tickers and build each ticker's payload.
         
+        `search(query, start_time, limit, end_time=None)` is the page source: a coroutine function
+        paging through up to `limit` search result pages and returning the tweet columns found, and
+        whether the results ran out before the limit.
+        """
         try:
-            # Set up Twitter API client
-            auth = tweepy.OAuthHandler(
-                self.twitter_credentials["api_key"], 
-                self.twitter_credentials["api_secret"]
-            )
-            auth.set_access_token(
-                self.twitter_credentials["access_token"], 
-                self.twitter_credentials["access_secret"]
-            )
-            api = tweepy.API(auth)
+            # Calculate date range (the search API works in UTC)
+            end_date = datetime.now(timezone.utc)
+            start_date = end_date - timedelta(days=days_back)
             
-            # Define search query
-            if asset_type == "crypto":
-                if ticker == "BTC":
-                    query = "$BTC OR #Bitcoin OR Bitcoin"
-                elif ticker == "ETH":
-                    query = "$ETH OR #Ethereum OR Ethereum"
-                else:
-                    query = f"${ticker} OR #{ticker}"
-            else:
-                query = f"${ticker} OR #{ticker} stock"
+            # One search shares the chunk's page budget, newest tweets first; tickers a busy ticker crowded out
+            # are topped up with their own search afterwards
+            queries = {ticker: self._social_query(ticker, asset_type) for ticker in chunk}
+            query = _combine_queries(queries.values())
             
-            # Calculate date range
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=days_back)
+            # Check the disk cache before searching
+            cache_path = self._social_cache_path(query, start_date, end_date)
+            columns = _read_cache(cache_path, self.social_cache_ttl)
             
-            # Collect tweets
-            tweets = []
-            for tweet in tweepy.Cursor(api.search_tweets, q=query, lang="en", 
-                                       tweet_mode="extended", count=100).items(500):
-                created_at = tweet.created_at
-                
-                if created_at < start_date:
-                    continue
-                
-                # Clean text
-                text = tweet.full_text
-                text = re.sub(r'http\S+', '', text)  # Remove URLs
-                text = re.sub(r'@\w+', '', text)     # Remove mentions
-                text = re.sub(r'RT\s+', '', text)    # Remove RT
-                text = re.sub(r'\s+', ' ', text)     # Normalize whitespace
-                text = text.strip()
-                
-                if len(text) < 10:  # Skip very short tweets
-                    continue
-                
-                # Calculate sentiment
-                sentiment = self.sentiment_analyzer.polarity_scores(text)
-                
-                # Create tweet entry
-                tweet_data = {
-                    "id": tweet.id_str,
-                    "created_at": created_at.strftime("%Y-%m-%d %H:%M:%S"),
-                    "text": text,
-                    "user_followers": tweet.user.followers_count,
-                    "retweet_count": tweet.retweet_count,
-                    "favorite_count": tweet.favorite_count,
-                    "sentiment": {
-                        "compound": sentiment["compound"],
-                        "positive": sentiment["pos"],
-                        "negative": sentiment["neg"],
-                        "neutral": sentiment["neu"],
-                        "label": "positive" if sentiment["compound"] >= 0.05 else 
-                                 "negative" if sentiment["compound"] <= -0.05 else "neutral"
-                    }
-                }
-                tweets.append(tweet_data)
+            if columns is None:
+                columns, complete = await search(query, start_date, TWEET_PAGES_PER_TICKER * len(chunk))
+                if not complete and len(chunk) > 1:
+                    await self._top_up_social(queries, columns, start_date, search)
+                _write_cache(cache_path, columns)
             
-            # Group tweets by day and hour for time series analysis
-            hourly_sentiment = {}
-            for tweet in tweets:
+            # Splitting and scoring the tweets is CPU-bound, so it runs off the event loop shared with the news batch
+            return await asyncio.to_thread(self._social_payloads, queries, columns, asset_type, days_back, 
+                                           start_date, end_date)
+        except Exception as e:
+            return {ticker: {"ticker": ticker, "error": f"Social sentiment collection failed: {str(e)}"} 
+                    for ticker in chunk}
+    
+    async def _search_tweets_threaded(self, query, start_time, limit, end_time=None):
+        """Page source running the shared sync Twitter client in a worker thread."""
+        return await asyncio.to_thread(self._search_tweets, query, start_time, limit, end_time)
+    
+    def _search_tweets(self, query, start_time, limit, end_time=None):
+        """Collect the tweet columns of up to `limit` recent search pages with the sync Twitter client."""
+        columns = _tweet_columns()
+        next_token = None
+        for response in tweepy.Paginator(self.twitter_limiter(self.twitter_client.search_recent_tweets), 
+                                         query=query, user_auth=self.twitter_user_auth, start_time=start_time, 
+                                         end_time=end_time, limit=limit, **_TWEET_SEARCH_PARAMS):
+            _append_tweets(columns, response)
+            next_token = response.meta.get("next_token")
+        return columns, next_token is None
+    
+    async def _search_tweets_async(self, client, query, start_time, limit, end_time=None):
+        """Async page source: collect the tweet columns of up to `limit` recent search pages with `client`."""
+        columns = _tweet_columns()
+        next_token = None
+        search_recent_tweets = self._retry_twitter_async(self.twitter_limiter(client.search_recent_tweets))
+        async for response in AsyncPaginator(search_recent_tweets, 
+                                             query=query, user_auth=self.twitter_user_auth, start_time=start_time, 
+                                             end_time=end_time, limit=limit, **_TWEET_SEARCH_PARAMS):
+            _append_tweets(columns, response)
+            next_token = response.meta.get("next_token")
+        return columns, next_token is None
+    
+    async def _top_up_social(self, queries, columns, start_date, search):
+        """Search alone, in place, for each ticker a truncated combined search left under its own page budget.
+        
+        The combined search saw every matching tweet back to its oldest one, so each top-up search starts
+        where it stopped and only asks for the pages the ticker is still short of.
+        """
+        target = TWEET_PAGES_PER_TICKER * _TWEET_SEARCH_PARAMS["max_results"]
+        reached = min(columns["created_at"]).replace(tzinfo=timezone.utc) if columns["created_at"] else None
+        
+        searches = []
+        for query in queries.values():
+            missing = target - len(_select_rows(columns, _query_terms_re(query))["id"])
+            if missing > 0:
+                pages = -(-missing // _TWEET_SEARCH_PARAMS["max_results"])
+                searches.append(search(_combine_queries([query]), start_date, pages, end_time=reached))
+        
+        seen = set(columns["id"])
+        for extra, _ in await asyncio.gather(*searches):
+            for i, tweet_id in enumerate(extra["id"]):
+                if tweet_id not in seen:
+                    seen.add(tweet_id)
+                    for field, values in columns.items():
+                        values.append(extra[field][i])
+    
+    def _retry_twitter_async(self, method):
+        """Wrap an async Twitter client method to retry 5xx responses with jittered backoff, like the sync session's adapter."""
+        @functools.wraps(method)
+        async def retrying(*args, **kwargs):
+            for attempt in range(HTTP_RETRIES + 1):
                 try:
-                    # Get date and hour
-                    created_dt = datetime.strptime(tweet["created_at"], "%Y-%m-%d %H:%M:%S")
-                    date_hour = created_dt.strftime("%Y-%m-%d %H")
-                    
-                    if date_hour not in hourly_sentiment:
-                        hourly_sentiment[date_hour] = {
-                            "tweets": 0,
-                            "sentiment_sum": 0,
-                            "sentiment_weighted_sum": 0,
-                            "total_weight": 0,
-                            "positive_count": 0,
-                            "negative_count": 0,
-                            "neutral_count": 0
-                        }
-                    
-                    # Calculate tweet importance weight based on engagement
-                    weight = 1 + 0.1 * (tweet["retweet_count"] + tweet["favorite_count"]) + 0.001 * tweet["user_followers"]
-                    
-                    hourly_sentiment[date_hour]["tweets"] += 1
-                    hourly_sentiment[date_hour]["sentiment_sum"] += tweet["sentiment"]["compound"]
-                    hourly_sentiment[date_hour]["sentiment_weighted_sum"] += tweet["sentiment"]["compound"] * weight
-                    hourly_sentiment[date_hour]["total_weight"] += weight
-                    
-                    if tweet["sentiment"]["label"] == "positive":
-                        hourly_sentiment[date_hour]["positive_count"] += 1
-                    elif tweet["sentiment"]["label"] == "negative":
-                        hourly_sentiment[date_hour]["negative_count"] += 1
-                    else:
-                        hourly_sentiment[date_hour]["neutral_count"] += 1
-                        
-                except Exception:
-                    continue
-            
+                    return await method(*args, **kwargs)
+                except tweepy.TwitterServerError as e:
+                    if e.response.status not in TWITTER_RETRY_STATUSES or attempt == HTTP_RETRIES:
+                        raise
+                await asyncio.sleep(_retry_delay(attempt))
+        return retrying
+    
+    def _social_cache_path(self, query, start_date, end_date):
+        """Cache file for tweet search results, keyed by query and the hour the date range starts and ends in."""
+        key = hashlib.md5(f"{query}|{start_date.strftime('%Y-%m-%d %H')}|{end_date.strftime('%Y-%m-%d %H')}".encode()).hexdigest()
+        return os.path.join(self.cache_dir, "social", f"{key}.json")
+    
+    def _social_payloads(self, queries, columns, asset_type, days_back, start_date, end_date):
+        """Split a combined search's tweets back to each ticker and build its payload."""
+        search_tickers = list(queries)
+        if len(queries) == 1:
+            return {ticker: self._social_payload(columns, ticker, asset_type, days_back, start_date, end_date, 
+                                                 search_tickers) 
+                    for ticker in queries}
+        return {ticker: self._social_payload(_select_rows(columns, _query_terms_re(query)), ticker, asset_type, 
+                                             days_back, start_date, end_date, search_tickers) 
+                for ticker, query in queries.items()}
+    
+    def _social_query(self, ticker, asset_type):
+        """Build the Twitter search query for a ticker."""
+        if asset_type == "crypto":
+            if ticker == "BTC":
+                return "$BTC OR #Bitcoin OR Bitcoin"
+            elif ticker == "ETH":
+                return "$ETH OR #Ethereum OR Ethereum"
+            return f"${ticker} OR #{ticker}"
+        return f"${ticker} OR #{ticker} stock"
+    
+    def _social_chunks(self, tickers, asset_type):
+        """Group tickers so each group's combined search query fits within the API's query length limit."""
+        chunks = []
+        for ticker in tickers:
+            candidate = [self._social_query(t, asset_type) for t in (chunks[-1] if chunks else [])]
+            candidate.append(self._social_query(ticker, asset_type))
+            if chunks and len(_combine_queries(candidate)) <= TWITTER_QUERY_MAX_LENGTH:
+                chunks[-1].append(ticker)
+            else:
+                chunks.append([ticker])
+        return chunks
+    
+    def _social_payload(self, columns, ticker, asset_type, days_back, start_date, end_date, search_tickers):
+        """Score one ticker's tweet columns and aggregate them into the social sentiment payload.
+        
+        `search_tickers` lists every ticker that shared the search, and with it the page budget, that found them.
+        """
+        # Tweet frame: one array per field, with sentiment for all tweets scored at once
+        tweets = {
+            "id": columns["id"],
+            "created_at": np.array(columns["created_at"], dtype="datetime64[s]"),
+            "text": columns["text"],
+            "user_followers": np.array(columns["user_followers"], dtype=np.int32),
+            "retweet_count": np.array(columns["retweet_count"], dtype=np.int32),
+            "favorite_count": np.array(columns["favorite_count"], dtype=np.int32),
+            **self._score_texts(columns["text"])
+        }
+        total_tweets = len(tweets["id"])
+        
+        # Group tweets by day and hour for time series analysis
+        hourly_averages = []
+        if total_tweets:
+            hours, hour_idx = np.unique(tweets["created_at"].astype("datetime64[h]"), return_inverse=True)
+            compound = _score_values(tweets, "compound")
+        
+            # Calculate tweet importance weight based on engagement
+            weight = 1 + 0.1 * (tweets["retweet_count"] + tweets["favorite_count"]) + 0.001 * tweets["user_followers"]
+        
+            counts = np.bincount(hour_idx)
+            sentiment_sum = np.bincount(hour_idx, weights=compound)
+            sentiment_weighted_sum = np.bincount(hour_idx, weights=compound * weight)
+            total_weight = np.bincount(hour_idx, weights=weight)
+            label_counts = _label_counts(hour_idx, tweets["label"], len(hours))
+        
             # Calculate hourly average sentiment
-            hourly_averages = []
-            for date_hour, data in hourly_sentiment.items():
-                if data["tweets"] > 0:
-                    avg_sentiment = data["sentiment_sum"] / data["tweets"]
-                    weighted_avg = data["sentiment_weighted_sum"] / data["total_weight"] if data["total_weight"] > 0 else avg_sentiment
-                    
-                    hourly_averages.append({
-                        "date_hour": date_hour,
-                        "tweets_count": data["tweets"],
-                        "avg_sentiment": round(avg_sentiment, 3),
-                        "weighted_sentiment": round(weighted_avg, 3),
-                        "positive_ratio": round(data["positive_count"] / data["tweets"], 3),
-                        "negative_ratio": round(data["negative_count"] / data["tweets"], 3),
-                        "neutral_ratio": round(data["neutral_count"] / data["tweets"], 3)
-                    })
-            
-            return {
-                "ticker": ticker,
-                "asset_type": asset_type,
-                "social_sentiment": {
-                    "hourly_averages": sorted(hourly_averages, key=lambda x: x["date_hour"]),
-                    "tweets": tweets[:100]  # Limit to first 100 tweets in output
-                },
-                "metadata": {
-                    "total_tweets": len(tweets),
-                    "period_days": days_back,
-                    "start_date": start_date.strftime("%Y-%m-%d"),
-                    "end_date": end_date.strftime("%Y-%m-%d"),
-                    "collected_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                }
+            avg_sentiment = sentiment_sum / counts
+            with np.errstate(divide="ignore", invalid="ignore"):
+                weighted_avg = np.where(total_weight > 0, sentiment_weighted_sum / total_weight, avg_sentiment)
+            ratios = label_counts / counts[:, None]
+            for date_hour, count, avg, weighted, (positive, negative, neutral) in zip(
+                    _format_datetimes(hours), counts.tolist(), avg_sentiment.tolist(), weighted_avg.tolist(), ratios.tolist()):
+                hourly_averages.append({
+                    "date_hour": date_hour,
+                    "tweets_count": count,
+                    "avg_sentiment": round(avg, 3),
+                    "weighted_sentiment": round(weighted, 3),
+                    "positive_ratio": round(positive, 3),
+                    "negative_ratio": round(negative, 3),
+                    "neutral_ratio": round(neutral, 3)
+                })
+        
+        # Materialize only the tweets included in the output (first 100)
+        output_tweets = [
+            {
+                "id": tweet_id,
+                "created_at": created_at,
+                "text": text,
+                "user_followers": followers,
+                "retweet_count": retweets,
+                "favorite_count": favorites,
+                "sentiment": sentiment
             }
-            
-        except Exception as e:
-            return {"ticker": ticker, "error": f"Social sentiment collection failed: {str(e)}"}
+            for tweet_id, created_at, text, followers, retweets, favorites, sentiment in zip(
+                tweets["id"][:100], _format_datetimes(tweets["created_at"][:100]), tweets["text"][:100],
+                tweets["user_followers"][:100].tolist(), tweets["retweet_count"][:100].tolist(),
+                tweets["favorite_count"][:100].tolist(), _sentiment_records(tweets, limit=100))
+        ]
+        
+        return {
+            "ticker": ticker,
+            "asset_type": asset_type,
+            "social_sentiment": {
+                "hourly_averages": sorted(hourly_averages, key=lambda x: x["date_hour"]),
+                "tweets": output_tweets
+            },
+            "metadata": {
+                "total_tweets": total_tweets,
+                "period_days": days_back,
+                "start_date": start_date.strftime("%Y-%m-%d"),
+                "end_date": end_date.strftime("%Y-%m-%d"),
+                "oldest_tweet_at": _format_datetimes(tweets["created_at"].min(keepdims=True))[0] if total_tweets else None,
+                "search_tickers": search_tickers,
+                "combined_search": len(search_tickers) > 1,
+                "collected_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            }
+        }
+    
+    async def _collect_text_sentiment_async(self, tickers, asset_type, collect_news, collect_social):
+        """Collect news and social sentiment for a batch concurrently; sources not requested come back empty."""
+        async def collect(enabled, collect_batch):
+            return await collect_batch(tickers, asset_type) if enabled else {}
+        
+        return await asyncio.gather(collect(collect_news, self.collect_news_sentiment_batch),
+                                    collect(collect_social, self.collect_social_sentiment_batch_async))
+    
+    def _output_path(self, directory, ticker, kind):
+        """Path of a per-ticker output file, with the extension of the configured serialization format."""
+        return os.path.join(directory, f"{ticker}_{kind}.{self.serialization_format}")
+    
+    def _write_output(self, path, data):
+        """Atomically write a per-ticker output file in the configured serialization format."""
+        _atomic_write(path, self._encode_output(data), OUTPUT_FILE_MODE)
     
     def collect_sentiment_data_batch(self, tickers, asset_type, collect_price=True, 
                                    collect_news=True, collect_social=True):
-        """Collect all sentiment data for a batch of tickers."""
-        results = {}
-        
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            # Collect price data
-            if collect_price:
-                print(f"Collecting price data for {len(tickers)} {asset_type}s...")
-                future_to_ticker = {
-                    executor.submit(self.collect_price_data, ticker, asset_type): ticker 
-                    for ticker in tickers
-                }
-                
-                for future in as_completed(future_to_ticker):
-                    ticker = future_to_ticker[future]
-                    try:
-                        data = future.result()
-                        if "error" not in data:
-                            # Save individual ticker data
-                            file_path = os.path.join(self.price_dir, f"{ticker}_price.json")
-                            with open(file_path, 'w') as f:
-                                json.dump(data, f, indent=2)
-                            
-                            if ticker not in results:
-                                results[ticker] = {}
-                            results[ticker]["price"] = data
-                            print(f"✓ Saved price data for {ticker}")
-                        else:
-                            print(f"✗ Error with price data for {ticker}: {data['error']}")
-                            if ticker not in results:
-                                results[ticker] = {}
-                            results[ticker]["price_error"] = data["error"]
-                    except Exception as e:
-                        print(f"✗ Error processing price data for {ticker}: {str(e)}")
-                        if ticker not in results:
-                            results[ticker] = {}
-                        results[ticker]["price_error"] = str(e)
-                    
-                    # Add a small delay
-                    time.sleep(0.5)
+        """Collect all sentiment data for a batch of tickers, keyed by ticker."""
+        results = defaultdict(dict)
+        pending_writes = {}
+        price_frames = {}
+        news_frames = {}
+        
+        # Collect price data
+        if collect_price:
+            print(f"Collecting price data for {len(tickers)} {asset_type}s...")
+            symbols = {ticker: ticker if asset_type != "crypto" else f"{ticker}-USD" for ticker in tickers}
             
-            # Collect news sentiment
+            # Download all tickers in one batched request instead of one request per ticker
+            try:
+                with self.yahoo_limiter:
+                    prices = yf.download(list(symbols.values()), period="30d", interval="1h", 
+                                         group_by="ticker", threads=True, progress=False)
+            except Exception as e:
+                print(f"✗ Error downloading price data: {str(e)}")
+                prices = pd.DataFrame()
+            
+            for ticker, symbol in symbols.items():
+                try:
+                    hist = prices[symbol] if isinstance(prices.columns, pd.MultiIndex) else prices
+                    data = self._compute_price_payload(hist.dropna(how="all"), ticker, asset_type, "30d", "1h")
+                    if "error" not in data:
+                        # Save individual ticker data
+                        file_path = self._output_path(self.price_dir, ticker, "price")
+                        pending_writes[file_path] = self._io_pool.submit(self._write_output, file_path, data)
+                        
+                        results[ticker]["price"] = data
+                        price_frames[ticker] = pd.DataFrame(data["price_data"])
+                        print(f"✓ Saved price data for {ticker}")
+                    else:
+                        print(f"✗ Error with price data for {ticker}: {data['error']}")
+                        results[ticker]["price_error"] = data["error"]
+                except Exception as e:
+                    print(f"✗ Error processing price data for {ticker}: {str(e)}")
+                    results[ticker]["price_error"] = str(e)
+        
+        # Collect news and social sentiment concurrently on one event loop
+        collect_social = collect_social and self.twitter_credentials is not None
+        if collect_news or collect_social:
             if collect_news:
                 print(f"Collecting news sentiment for {len(tickers)} {asset_type}s...")
-                future_to_ticker = {
-                    executor.submit(self.collect_news_sentiment, ticker, asset_type): ticker 
-                    for ticker in tickers
-                }
-                
-                for future in as_completed(future_to_ticker):
-                    ticker = future_to_ticker[future]
-                    try:
-                        data = future.result()
-                        if "error" not in data:
-                            # Save individual ticker data
-                            file_path = os.path.join(self.news_dir, f"{ticker}_news.json")
-                            with open(file_path, 'w') as f:
-                                json.dump(data, f, indent=2)
-                            
-                            if ticker not in results:
-                                results[ticker] = {}
-                            results[ticker]["news"] = data
-                            print(f"✓ Saved news sentiment for {ticker}")
-                        else:
-                            print(f"✗ Error with news sentiment for {ticker}: {data['error']}")
-                            if ticker not in results:
-                                results[ticker] = {}
-                            results[ticker]["news_error"] = data["error"]
-                    except Exception as e:
-                        print(f"✗ Error processing news sentiment for {ticker}: {str(e)}")
-                        if ticker not in results:
-                            results[ticker] = {}
-                        results[ticker]["news_error"] = str(e)
-                    
-                    # Add a small delay
-                    time.sleep(1)
-            
-            # Collect social sentiment
-            if collect_social and self.twitter_credentials:
+            if collect_social:
                 print(f"Collecting social sentiment for {len(tickers)} {asset_type}s...")
-                future_to_ticker = {
-                    executor.submit(self.collect_social_sentiment, ticker, asset_type): ticker 
-                    for ticker in tickers
-                }
-                
-                for future in as_completed(future_to_ticker):
-                    ticker = future_to_ticker[future]
-                    try:
-                        data = future.result()
-                        if "error" not in data:
-                            # Save individual ticker data
-                            file_path = os.path.join(self.social_dir, f"{ticker}_social.json")
-                            with open(file_path, 'w') as f:
-                                json.dump(data, f, indent=2)
-                            
-                            if ticker not in results:
-                                results[ticker] = {}
-                            results[ticker]["social"] = data
-                            print(f"✓ Saved social sentiment for {ticker}")
-                        else:
-                            print(f"✗ Error with social sentiment for {ticker}: {data['error']}")
-                            if ticker not in results:
-                                results[ticker] = {}
-                            results[ticker]["social_error"] = data["error"]
-                    except Exception as e:
-                        print(f"✗ Error processing social sentiment for {ticker}: {str(e)}")
-                        if ticker not in results:
-                            results[ticker] = {}
-                        results[ticker]["social_error"] = str(e)
+            news_results, social_results = asyncio.run(
+                self._collect_text_sentiment_async(tickers, asset_type, collect_news, collect_social))
+            
+            for ticker, data in news_results.items():
+                try:
+                    if "error" not in data:
+                        # Save individual ticker data
+                        file_path = self._output_path(self.news_dir, ticker, "news")
+                        pending_writes[file_path] = self._io_pool.submit(self._write_output, file_path, data)
+                        
+                        results[ticker]["news"] = data
+                        articles = data.get("news_sentiment", {}).get("articles")
+                        if articles:
+                            news_frames[ticker] = pd.json_normalize(articles, sep="_")
+                        print(f"✓ Saved news sentiment for {ticker}")
+                    else:
+                        print(f"✗ Error with news sentiment for {ticker}: {data['error']}")
+                        results[ticker]["news_error"] = data["error"]
+                except Exception as e:
+                    print(f"✗ Error processing news sentiment for {ticker}: {str(e)}")
+                    results[ticker]["news_error"] = str(e)
+            
+            for ticker, data in social_results.items():
+                if "error" not in data:
+                    # Save individual ticker data
+                    file_path = self._output_path(self.social_dir, ticker, "social")
+                    pending_writes[file_path] = self._io_pool.submit(self._write_output, file_path, data)
                     
-                    # Add a small delay to avoid rate limits
-                    time.sleep(2)
\ No newline at end of file
+                    results[ticker]["social"] = data
+                    print(f"✓ Saved social sentiment for {ticker}")
+                else:
+                    print(f"✗ Error with social sentiment for {ticker}: {data['error']}")
+                    results[ticker]["social_error"] = data["error"]
+        
+        # Aggregate all tickers into one columnar file per data type for the analytical path, named by
+        # when the batch finished so later batches of the same asset type don't overwrite it
+        batch_id = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        for kind, frames in (("price", price_frames), ("news", news_frames)):
+            if frames:
+                file_path = os.path.join(self.combined_dir, f"{asset_type}_{kind}_{batch_id}.parquet")
+                pending_writes[file_path] = self._io_pool.submit(_write_parquet, file_path, frames)
+        
+        # Wait for the background writes and report any that failed
+        for file_path, write in pending_writes.items():
+            try:
+                write.result()
+            except Exception as e:
+                print(f"✗ Error writing {file_path}: {str(e)}")
+        
+        return dict(results)
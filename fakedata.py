@@ -1,99 +1,168 @@
 from faker import Faker
-import random
+import numpy as np
 from datetime import datetime, timedelta
-import json
-
-# Initialize Faker
-fake = Faker()
-
-# Set random seed for reproducibility
-random.seed(42)
-Faker.seed(42)
-
-def generate_fake_tweets(num_tweets=10000):
-    """Generate fake tweets about Google with financial topics and emojis."""
-    
-    # Google-related financial keywords
-    google_products = ['Google Search', 'Gmail', 'Google Cloud', 'Android', 'YouTube', 
-                      'Google Maps', 'Google Workspace', 'Google AI', 'Google Ads', 
-                      'Chrome', 'Pixel', 'Google Assistant']
-
-    financial_terms = ['earnings', 'revenue', 'growth', 'profit', 'loss', 'stock', 
-                       'market cap', 'valuation', 'acquisition', 'investment']
-
-    # Define tweet patterns with emojis
-    tweet_patterns = [
-        "🚀 $GOOG is looking strong today! Huge gains incoming!",
-        "🔥 $GOOG breaking out to new highs! Investors are excited!",
-        "Google's {product} revenue surged by {percent}% 💰💡",
-        "Massive earnings beat! Google reports {value} billion in revenue! 💵🚀",
-        "Bullish on {product}, impressive performance! 📈🔥",
-        "Google just acquired {company}, big move! 💼💡",
-        "Strong demand for Google's {product}, stock is flying! 🚀💰",
-        "Google stock up {percent}% after stellar earnings report! 📈💵",
-        "Investors are loving Google's latest {product} innovation! 🔥💡",
-        "Google under pressure after missing earnings! 📉",
-        "⚠️ $GOOG breaking down, rough market reaction! 📉",
-        "Google's {product} faces tough competition from {company}.",
-        "Regulatory concerns hitting Google, potential lawsuits ahead! ⚖️📉",
-        "Google layoffs reported in {product} division, stock down! 😞",
-        "📢 Google announces updates for {product} at its latest event.",
-        "📊 $GOOG trading sideways, waiting for earnings.",
-        "💡 Google investing in {product}, interesting development!",
-        "🤝 Google partnering with {company} on new tech initiative.",
-        "📈 Google hiring aggressively in {product} sector.",
-        "📢 Google conference reveals new {product} features."
-    ]
-
-    # Generate tweets
-    tweets = []
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=90)
-
-    for _ in range(num_tweets):
-        # Choose a random tweet pattern
-        pattern = random.choice(tweet_patterns)
-
-        # Replace placeholders with fake data
-        tweet = pattern.replace('{product}', random.choice(google_products))
-        tweet = tweet.replace('{company}', fake.company())
-        tweet = tweet.replace('{percent}', f"{random.randint(1, 15)}%")
-        tweet = tweet.replace('{value}', f"{random.uniform(10, 50):.2f}")
+from itertools import combinations
+from multiprocessing import Pool
+from string import Formatter
+import orjson
+
+# Number of independently seeded chunks the tweets are generated in. Fixed rather than tied to the
+# CPU count so the output is the same on every machine.
+NUM_CHUNKS = 8
+
+# Sizes of the pools of fake company names and usernames that tweets draw from
+COMPANY_POOL_SIZE = 500
+USERNAME_POOL_SIZE = 2000
+
+# Google-related financial keywords
+google_products = ['Google Search', 'Gmail', 'Google Cloud', 'Android', 'YouTube', 
+                  'Google Maps', 'Google Workspace', 'Google AI', 'Google Ads', 
+                  'Chrome', 'Pixel', 'Google Assistant']
+
+financial_terms = ['earnings', 'revenue', 'growth', 'profit', 'loss', 'stock', 
+                   'market cap', 'valuation', 'acquisition', 'investment']
+
+hashtags = ['#Google', '#GOOG', '#Stocks', '#Finance', '#TechStocks', '#Investing']
+
+# Every hashtag suffix a tweet can get, pre-joined and grouped by how many distinct tags it has
+hashtag_suffixes = {k: [" " + " ".join(combo) for combo in combinations(hashtags, k)] for k in (1, 2, 3)}
+
+# Define tweet patterns with emojis
+tweet_patterns = [
+    "🚀 $GOOG is looking strong today! Huge gains incoming!",
+    "🔥 $GOOG breaking out to new highs! Investors are excited!",
+    "Google's {product} revenue surged by {percent}% 💰💡",
+    "Massive earnings beat! Google reports {value} billion in revenue! 💵🚀",
+    "Bullish on {product}, impressive performance! 📈🔥",
+    "Google just acquired {company}, big move! 💼💡",
+    "Strong demand for Google's {product}, stock is flying! 🚀💰",
+    "Google stock up {percent}% after stellar earnings report! 📈💵",
+    "Investors are loving Google's latest {product} innovation! 🔥💡",
+    "Google under pressure after missing earnings! 📉",
+    "⚠️ $GOOG breaking down, rough market reaction! 📉",
+    "Google's {product} faces tough competition from {company}.",
+    "Regulatory concerns hitting Google, potential lawsuits ahead! ⚖️📉",
+    "Google layoffs reported in {product} division, stock down! 😞",
+    "📢 Google announces updates for {product} at its latest event.",
+    "📊 $GOOG trading sideways, waiting for earnings.",
+    "💡 Google investing in {product}, interesting development!",
+    "🤝 Google partnering with {company} on new tech initiative.",
+    "📈 Google hiring aggressively in {product} sector.",
+    "📢 Google conference reveals new {product} features."
+]
+
+# Positional format field each pattern slot compiles to; the slot's value is formatted when the tweet is filled
+slot_formats = {'product': '{}', 'company': '{}', 'percent': '{}%', 'value': '{:.2f}'}
+
+def _compile_pattern(pattern):
+    """Compile a tweet pattern to a (template, slot names) pair; plain patterns keep their text and no slots."""
+    template, slot_names = [], []
+    for literal, slot, _, _ in Formatter().parse(pattern):
+        template.append(literal.replace('{', '{{').replace('}', '}}'))
+        if slot is not None:
+            if slot not in slot_formats:
+                raise KeyError(f"Unknown slot {{{slot}}} in tweet pattern: {pattern!r}")
+            template.append(slot_formats[slot])
+            slot_names.append(slot)
+    template = ''.join(template)
+    if not slot_names:
+        return template.format(), ()  # unescaped text, used as-is
+    return template, tuple(slot_names)
+
+# Tweet patterns compiled once, so only the slots a pattern actually has are filled per tweet
+compiled_patterns = [_compile_pattern(pattern) for pattern in tweet_patterns]
+
+def _gen_chunk(num_tweets, seed, start_date, end_date, companies, usernames):
+    """Generate one chunk of fake tweets with its own seeded random generator."""
+    rng = np.random.default_rng(seed)
+
+    # Draw every random choice for the chunk up front, one array per field
+    pattern_idx = rng.integers(0, len(tweet_patterns), num_tweets).tolist()
+    product_idx = rng.integers(0, len(google_products), num_tweets).tolist()
+    percents = rng.integers(1, 16, num_tweets).tolist()
+    values = rng.uniform(10, 50, num_tweets).tolist()
+    add_hashtags = (rng.random(num_tweets) < 0.3).tolist()  # 30% probability
+    hashtag_counts = rng.integers(1, 4, num_tweets).tolist()
+    hashtag_picks = rng.random(num_tweets).tolist()
+    add_cashtags = (rng.random(num_tweets) < 0.4).tolist()  # 40% probability
+    company_idx = rng.integers(0, len(companies), num_tweets).tolist()
+    username_idx = rng.integers(0, len(usernames), num_tweets).tolist()
+
+    # Generate random timestamps within the date range, at microsecond resolution
+    span = (end_date - start_date) // timedelta(microseconds=1)
+    offsets = rng.integers(0, span, num_tweets).astype('timedelta64[us]')
+    timestamps = (np.datetime64(start_date, 'us') + offsets).astype(str).tolist()
+
+    # Simulate engagement metrics
+    followers = rng.integers(50, 500001, num_tweets).tolist()
+    retweets = rng.integers(0, 2001, num_tweets).tolist()
+    likes = rng.integers(0, 5001, num_tweets).tolist()
+
+    # Per-tweet value of every slot, looked up by slot name when a pattern is filled
+    slot_values = {
+        'product': [google_products[j] for j in product_idx],
+        'company': [companies[j] for j in company_idx],
+        'percent': percents,
+        'value': values
+    }
 
-        # Add hashtags (30% probability)
-        if random.random() < 0.3:
-            hashtags = random.sample(['#Google', '#GOOG', '#Stocks', '#Finance', '#TechStocks', '#Investing'], k=random.randint(1, 3))
-            tweet += " " + " ".join(hashtags)
-
-        # Add cashtags (40% probability)
-        if random.random() < 0.4:
+    tweets = []
+    for i in range(num_tweets):
+        # Fill only the slots the chosen tweet pattern has; plain patterns are used as they are
+        tweet, slot_names = compiled_patterns[pattern_idx[i]]
+        if slot_names:
+            tweet = tweet.format(*[slot_values[slot][i] for slot in slot_names])
+
+        # Add 1-3 distinct hashtags, picked uniformly among the suffixes with that many tags
+        if add_hashtags[i]:
+            suffixes = hashtag_suffixes[hashtag_counts[i]]
+            tweet += suffixes[int(hashtag_picks[i] * len(suffixes))]
+
+        # Add cashtags
+        if add_cashtags[i]:
             tweet += " $GOOG"
-        
-        # Generate random timestamp within the past 90 days
-        tweet_date = fake.date_time_between(start_date=start_date, end_date=end_date)
-
-        # Simulate engagement metrics
-        followers = random.randint(50, 500000)
-        retweets = random.randint(0, 2000)
-        likes = random.randint(0, 5000)
 
         # Append tweet data
         tweets.append({
-            'username': fake.user_name(),
+            'username': usernames[username_idx[i]],
             'tweet_text': tweet,
-            'timestamp': tweet_date.isoformat(),
-            'followers': followers,
-            'retweets': retweets,
-            'likes': likes
+            'timestamp': timestamps[i],
+            'followers': followers[i],
+            'retweets': retweets[i],
+            'likes': likes[i]
         })
 
     return tweets
 
-# Generate fake tweets
-tweets_data = generate_fake_tweets(10000)
+def _gen_chunk_from_args(args):
+    """Unpack one chunk's arguments for Pool.imap, which passes a single argument."""
+    return _gen_chunk(*args)
 
-# Save to JSON file
-with open('google_financial_tweets.json', 'w') as json_file:
-    json.dump(tweets_data, json_file, indent=4)
+def generate_fake_tweets(num_tweets=10000, processes=None):
+    """Yield fake tweets about Google with financial topics and emojis, generated in parallel chunks."""
+    end_date = datetime.now()
+    start_date = end_date - timedelta(days=90)
 
-print(f"Generated {len(tweets_data)} tweets and saved to 'google_financial_tweets.json'")
+    # Company names and usernames are generated once and shared by all chunks
+    fake = Faker()
+    fake.seed_instance(42)
+    companies = [fake.company() for _ in range(COMPANY_POOL_SIZE)]
+    usernames = [fake.user_name() for _ in range(USERNAME_POOL_SIZE)]
+
+    # Split the tweets across chunks seeded 42, 43, ...; a pool of `processes` workers (default: one
+    # per CPU) generates them, and chunks are yielded in seed order as soon as each is ready
+    sizes = [num_tweets // NUM_CHUNKS + (i < num_tweets % NUM_CHUNKS) for i in range(NUM_CHUNKS)]
+    with Pool(processes) as pool:
+        for chunk in pool.imap(_gen_chunk_from_args, [(size, 42 + i, start_date, end_date, companies, usernames) 
+                                                      for i, size in enumerate(sizes)]):
+            yield from chunk
+
+if __name__ == '__main__':
+    # Stream fake tweets straight to a JSON Lines file, one compact tweet object per line
+    num_written = 0
+    with open('google_financial_tweets.jsonl', 'wb') as jsonl_file:
+        for tweet in generate_fake_tweets(10000):
+            jsonl_file.write(orjson.dumps(tweet, option=orjson.OPT_APPEND_NEWLINE))
+            num_written += 1
+
+    print(f"Generated {num_written} tweets and saved to 'google_financial_tweets.jsonl'")